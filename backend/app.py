@@ -30,6 +30,7 @@ async def lifespan(app: FastAPI):
     
     # Shutdown
     logger.info("Shutting down Climatech API server")
+    await climatology.historical_service.close()
 
 
 # Create FastAPI app
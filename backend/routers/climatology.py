@@ -15,10 +15,11 @@ from models.weather_data import ExtendedForecastResponse
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
-# Initialize services
+# Initialize services once; the router shares the forecast service's instances
+# so the process holds a single cache handle and settings lookup
 forecast_service = ForecastService()
-historical_service = HistoricalDataService()
-climatology_service = ClimatologyService()
+historical_service: HistoricalDataService = forecast_service.historical_service
+climatology_service: ClimatologyService = forecast_service.climatology_service
 
 
 @router.post("/forecast/extended", response_model=ExtendedForecastResponse)
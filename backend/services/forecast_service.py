@@ -12,6 +12,7 @@ from models.weather_data import (
     ExtendedForecastResponse
 )
 from models.forecast_models import LocationClimateProfile
+from utils.date_utils import get_season
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +24,59 @@ class ForecastService:
         self.climatology_service = ClimatologyService()
         self.historical_service = HistoricalDataService()
         self.max_forecast_days = 180  # 6 months
+        
+        # Numeric scores used when averaging confidence levels
+        self.CONFIDENCE_SCORES = {
+            ConfidenceLevel.HIGH: 3,
+            ConfidenceLevel.MEDIUM: 2,
+            ConfidenceLevel.LOW: 1
+        }
+        
+        # Monthly wind lookup tables, indexed by month - 1
+        self.SYNTHETIC_WIND_MONTH_FACTORS = (
+            1.2,   # January - Winter storm season
+            1.15,  # February - Still stormy
+            1.1,   # March - Transition, still windy
+            1.0,   # April - Spring, moderate
+            0.9,   # May - Spring, calming
+            0.8,   # June - Early summer, calm
+            0.75,  # July - Summer minimum
+            0.8,   # August - Late summer
+            0.9,   # September - Fall pickup
+            1.0,   # October - Fall winds increasing
+            1.1,   # November - Getting stormy
+            1.15   # December - Winter storm approach
+        )
+        # More moderate seasonal wind patterns (Northern Hemisphere)
+        self.SEASONAL_WIND_FACTORS = (
+            1.15,  # January - Winter, stronger winds
+            1.15,  # February - Winter, stronger winds
+            1.05,  # March - Transition, moderate winds
+            1.0,   # April - Spring, moderate winds
+            0.95,  # May - Spring, slightly calmer
+            0.9,   # June - Early summer, calmer
+            0.9,   # July - Summer, calmer
+            0.9,   # August - Late summer, calmer
+            0.95,  # September - Early fall, increasing
+            1.0,   # October - Fall, moderate
+            1.05,  # November - Late fall, increasing
+            1.15   # December - Early winter, stronger
+        )
+        # More realistic monthly wind speeds (km/h) for temperate climate
+        self.SEASONAL_WIND_BASE = (
+            18.0,  # January - Winter storms, stronger winds
+            17.0,  # February - Still windy in winter
+            16.0,  # March - Transition, still breezy
+            14.0,  # April - Spring, moderate winds
+            12.0,  # May - Spring, calmer but still breezy
+            11.0,  # June - Early summer, lighter winds
+            10.0,  # July - Summer, lightest winds
+            11.0,  # August - Late summer, picking up
+            13.0,  # September - Fall transition, windier
+            15.0,  # October - Fall, getting windier
+            16.0,  # November - Late fall, windy
+            17.0   # December - Winter approaching, strong winds
+        )
     
     async def generate_extended_forecast(
         self,
@@ -49,7 +103,7 @@ class ForecastService:
         
         # Get recent conditions for persistence forecasting
         recent_data = await self.historical_service.get_recent_conditions(
-            latitude, longitude, days=10
+            latitude, longitude, days=10, historical_data=historical_data
         )
         
         # Calculate data quality
@@ -59,6 +113,10 @@ class ForecastService:
         )
         data_quality = self.historical_service.validate_data_quality(historical_data)
         
+        # Values shared by every forecast day are built once
+        context = self._build_forecast_context(historical_data, recent_data)
+        record_arrays = context["record_arrays"]
+        
         # Generate daily forecasts
         daily_forecasts = []
         climate_normals = []
@@ -66,23 +124,29 @@ class ForecastService:
         for day_offset in range(forecast_days):
             forecast_date = start_date + timedelta(days=day_offset)
             
+            # Calculate the climate normal once; it feeds the forecast and the context
+            try:
+                climate_normal = self.climatology_service.calculate_day_of_year_climatology(
+                    historical_data, forecast_date, record_arrays
+                )
+            except ValueError:
+                # No climate normal available for this date
+                climate_normal = None
+            
             # Generate forecast for this day
             forecast = await self._generate_daily_forecast(
-                latitude, longitude, forecast_date, 
-                historical_data, recent_data, day_offset + 1
+                latitude=latitude,
+                longitude=longitude,
+                forecast_date=forecast_date,
+                days_ahead=day_offset + 1,
+                context=context,
+                climate_normal=climate_normal
             )
             daily_forecasts.append(forecast)
             
-            # Calculate climate normal if requested
-            if include_climate_context:
-                try:
-                    climate_normal = self.climatology_service.calculate_day_of_year_climatology(
-                        historical_data, forecast_date
-                    )
-                    climate_normals.append(climate_normal)
-                except ValueError:
-                    # Skip if no climate normal available for this date
-                    pass
+            # Include climate normal if requested
+            if include_climate_context and climate_normal is not None:
+                climate_normals.append(climate_normal)
         
         # Generate monthly outlooks
         monthly_outlooks = self._generate_monthly_outlooks(daily_forecasts, start_date)
@@ -91,7 +155,7 @@ class ForecastService:
         avg_confidence = self._calculate_overall_confidence(daily_forecasts, data_quality["overall_quality"])
         
         # Generate seasonal outlook
-        seasonal_outlook = self._generate_seasonal_outlook(historical_data, start_date, forecast_days)
+        seasonal_outlook = self._generate_seasonal_outlook(context["seasonal_trends"], start_date, forecast_days)
         
         # Detect notable patterns
         notable_patterns = self._detect_notable_patterns(historical_data, daily_forecasts)
@@ -111,17 +175,63 @@ class ForecastService:
             notable_patterns=notable_patterns
         )
     
+    def _group_by_month(
+        self, 
+        historical_data: List[HistoricalWeatherData]
+    ) -> Dict[int, List[HistoricalWeatherData]]:
+        """Group historical records by calendar month, preserving record order"""
+        
+        month_groups = {}
+        for record in historical_data:
+            month_groups.setdefault(record.date.month, []).append(record)
+        
+        return month_groups
+    
+    def _build_forecast_context(
+        self, 
+        historical_data: List[HistoricalWeatherData],
+        recent_data: List[HistoricalWeatherData]
+    ) -> Dict:
+        """Build the per-forecast values shared by every daily forecast
+        
+        The record arrays and the wind direction memo are tied to this exact
+        historical_data list and must not be reused with another history.
+        """
+        
+        record_arrays = self.climatology_service.build_record_arrays(historical_data)
+        
+        return {
+            "historical_data": historical_data,
+            "recent_data": recent_data,
+            # Bucket records by calendar month once; the per-day helpers only need one month
+            "month_groups": self._group_by_month(historical_data),
+            "record_arrays": record_arrays,
+            # Seasonal trends depend only on the history, not on the forecast day
+            "seasonal_trends": self.climatology_service.calculate_seasonal_trends(
+                historical_data, record_arrays
+            ),
+            "base_year": min(d.date.year for d in historical_data),
+            # Wind direction climatology depends only on the calendar month
+            "wind_directions": {}
+        }
+    
     async def _generate_daily_forecast(
         self,
+        *,
         latitude: float,
         longitude: float,
         forecast_date: date,
-        historical_data: List[HistoricalWeatherData],
-        recent_data: List[HistoricalWeatherData],
-        days_ahead: int
+        days_ahead: int,
+        context: Dict,
+        climate_normal: Optional[ClimateNormal]
     ) -> WeatherForecast:
         """Generate forecast for a single day"""
         
+        historical_data = context["historical_data"]
+        recent_data = context["recent_data"]
+        wind_directions = context["wind_directions"]
+        month_data = context["month_groups"].get(forecast_date.month, [])
+        
         # Use different methods based on forecast horizon
         if days_ahead <= 7:
             # Short-range: primarily persistence with climatology
@@ -130,7 +240,7 @@ class ForecastService:
             )
             
             analog_result = self.climatology_service.analog_forecast(
-                historical_data, recent_data, forecast_date
+                historical_data, recent_data, forecast_date, context["record_arrays"]
             )
             
             # Blend persistence and analog methods
@@ -151,19 +261,19 @@ class ForecastService:
                          weight_analog * analog_result["precipitation"])
             
             # Apply realistic constraints and seasonal adjustment
-            seasonal_precip = self._get_seasonal_precipitation_normal(historical_data, forecast_date)
+            seasonal_precip = self._get_seasonal_precipitation_normal(month_data, forecast_date)
             precipitation = max(0.0, min(precip_raw * 0.6 + seasonal_precip * 0.4, 80.0))
             
             # Apply realistic constraints to other parameters
-            humidity = np.clip(
+            humidity = max(15.0, min(
                 weight_persistence * persistence_result["humidity"] + 
                 weight_analog * analog_result["humidity"], 
-                15.0, 100.0
-            )
+                100.0
+            ))
             base_wind = (weight_persistence * persistence_result["wind_speed"] + 
                         weight_analog * analog_result["wind_speed"])
             wind_speed = self._calculate_realistic_wind_speed(
-                historical_data, forecast_date, base_wind
+                month_data, forecast_date, base_wind
             )
             
             method_confidence = (persistence_result["confidence"] + analog_result["confidence"]) / 2
@@ -171,18 +281,13 @@ class ForecastService:
         else:
             # Long-range: primarily climatology
             try:
-                climate_normal = self.climatology_service.calculate_day_of_year_climatology(
-                    historical_data, forecast_date
-                )
-                
-                # Add seasonal trends
-                seasonal_trends = self.climatology_service.calculate_seasonal_trends(historical_data)
+                if climate_normal is None:
+                    raise ValueError(f"No climate normal available for {forecast_date}")
                 
                 # Apply trend adjustments
-                current_year = forecast_date.year
-                years_since_base = current_year - min(d.date.year for d in historical_data)
+                years_since_base = forecast_date.year - context["base_year"]
                 
-                temp_trend_adjustment = (seasonal_trends["annual_trends"]["temp_max"]["slope"] * 
+                temp_trend_adjustment = (context["seasonal_trends"]["annual_trends"]["temp_max"]["slope"] * 
                                        years_since_base)
                 
                 temp_max = climate_normal.temperature_max_normal + temp_trend_adjustment
@@ -190,52 +295,37 @@ class ForecastService:
                 
                 # Better precipitation handling for long-range forecasts
                 base_precipitation = climate_normal.precipitation_normal
-                seasonal_variance = self._calculate_seasonal_precipitation_variance(historical_data, forecast_date)
+                seasonal_variance = self._calculate_seasonal_precipitation_variance(month_data)
                 precipitation = max(0.0, base_precipitation * (0.8 + seasonal_variance * 0.4))
                 
-                humidity = np.clip(climate_normal.humidity_normal, 20.0, 100.0)
+                humidity = max(20.0, min(climate_normal.humidity_normal, 100.0))
                 wind_speed = self._calculate_realistic_wind_speed(
-                    historical_data, forecast_date, climate_normal.wind_speed_normal
+                    month_data, forecast_date, climate_normal.wind_speed_normal
                 )
                 
                 # Reduced confidence for long-range forecasts
                 method_confidence = max(0.3, 0.8 - (days_ahead - 7) * 0.01)
                 
             except ValueError:
-                # Fallback to seasonal averages if no specific climatology available
-                month_data = [d for d in historical_data if d.date.month == forecast_date.month]
-                
-                if month_data:
-                    temp_max = np.mean([d.temperature_max for d in month_data])
-                    temp_min = np.mean([d.temperature_min for d in month_data])
-                    precipitation = np.mean([d.precipitation for d in month_data])
-                    humidity = np.mean([d.humidity for d in month_data])
-                    base_wind = np.mean([d.wind_speed for d in month_data])
-                    wind_speed = self._calculate_realistic_wind_speed(
-                        historical_data, forecast_date, base_wind
-                    )
-                else:
-                    # Last resort: use overall averages
-                    temp_max = np.mean([d.temperature_max for d in historical_data])
-                    temp_min = np.mean([d.temperature_min for d in historical_data])
-                    precipitation = np.mean([d.precipitation for d in historical_data])
-                    humidity = np.mean([d.humidity for d in historical_data])
-                    base_wind = np.mean([d.wind_speed for d in historical_data])
-                    wind_speed = self._calculate_realistic_wind_speed(
-                        historical_data, forecast_date, base_wind
-                    )
+                # Fallback to seasonal averages if no specific climatology available,
+                # or as a last resort to overall averages
+                fallback_data = month_data if month_data else historical_data
+                temp_max, temp_min, precipitation, humidity, base_wind = np.array([
+                    (d.temperature_max, d.temperature_min, d.precipitation, d.humidity, d.wind_speed)
+                    for d in fallback_data
+                ]).mean(axis=0)
+                wind_speed = self._calculate_realistic_wind_speed(
+                    month_data, forecast_date, base_wind
+                )
                 
                 method_confidence = 0.3
         
         # Calculate climate context
-        try:
-            climate_normal = self.climatology_service.calculate_day_of_year_climatology(
-                historical_data, forecast_date
-            )
+        if climate_normal is not None:
             temp_vs_normal = (temp_max + temp_min) / 2 - (
                 climate_normal.temperature_max_normal + climate_normal.temperature_min_normal) / 2
             precip_vs_normal = ((precipitation / max(0.1, climate_normal.precipitation_normal)) - 1) * 100
-        except ValueError:
+        else:
             temp_vs_normal = 0.0
             precip_vs_normal = 0.0
         
@@ -245,9 +335,12 @@ class ForecastService:
         )
         
         # Determine wind direction
-        wind_direction = self.climatology_service.determine_wind_direction(
-            historical_data, forecast_date
-        )
+        wind_direction = wind_directions.get(forecast_date.month)
+        if wind_direction is None:
+            wind_direction = self.climatology_service.determine_wind_direction(
+                historical_data, forecast_date
+            )
+            wind_directions[forecast_date.month] = wind_direction
 
         
         # Calculate confidence levels
@@ -262,7 +355,7 @@ class ForecastService:
         
         # Calculate precipitation probability using climatological approach
         precip_probability = self._calculate_precipitation_probability(
-            historical_data, forecast_date, precipitation
+            month_data, precipitation
         )
         
         return WeatherForecast(
@@ -332,13 +425,8 @@ class ForecastService:
             # Calculate confidence
             confidences = []
             for f in forecasts:
-                conf_values = {
-                    ConfidenceLevel.HIGH: 3,
-                    ConfidenceLevel.MEDIUM: 2,
-                    ConfidenceLevel.LOW: 1
-                }
-                avg_conf = (conf_values[f.temperature_max_confidence] + 
-                           conf_values[f.precipitation_confidence]) / 2
+                avg_conf = (self.CONFIDENCE_SCORES[f.temperature_max_confidence] + 
+                           self.CONFIDENCE_SCORES[f.precipitation_confidence]) / 2
                 confidences.append(avg_conf)
             
             avg_conf_value = np.mean(confidences)
@@ -373,16 +461,11 @@ class ForecastService:
         """Calculate overall forecast confidence"""
         
         confidence_scores = []
-        confidence_mapping = {
-            ConfidenceLevel.HIGH: 3,
-            ConfidenceLevel.MEDIUM: 2,
-            ConfidenceLevel.LOW: 1
-        }
         
         for forecast in daily_forecasts:
             # Average confidence across parameters
-            temp_conf = confidence_mapping[forecast.temperature_max_confidence]
-            precip_conf = confidence_mapping[forecast.precipitation_confidence]
+            temp_conf = self.CONFIDENCE_SCORES[forecast.temperature_max_confidence]
+            precip_conf = self.CONFIDENCE_SCORES[forecast.precipitation_confidence]
             avg_conf = (temp_conf + precip_conf) / 2
             confidence_scores.append(avg_conf)
         
@@ -401,7 +484,7 @@ class ForecastService:
     
     def _generate_seasonal_outlook(
         self, 
-        historical_data: List[HistoricalWeatherData], 
+        seasonal_trends: Dict, 
         start_date: date, 
         forecast_days: int
     ) -> str:
@@ -413,22 +496,11 @@ class ForecastService:
         seasons = set()
         current_date = start_date
         while current_date <= end_date:
-            month = current_date.month
-            if month in [12, 1, 2]:
-                seasons.add("winter")
-            elif month in [3, 4, 5]:
-                seasons.add("spring")
-            elif month in [6, 7, 8]:
-                seasons.add("summer")
-            else:
-                seasons.add("autumn")
+            seasons.add(get_season(current_date))
             
             current_date += timedelta(days=32)  # Jump to next month
             current_date = current_date.replace(day=1)
         
-        # Analyze historical trends for these seasons
-        seasonal_trends = self.climatology_service.calculate_seasonal_trends(historical_data)
-        
         outlook_parts = []
         
         if "winter" in seasons:
@@ -502,14 +574,12 @@ class ForecastService:
     
     def _get_seasonal_precipitation_normal(
         self, 
-        historical_data: List[HistoricalWeatherData], 
+        month_data: List[HistoricalWeatherData], 
         forecast_date: date
     ) -> float:
         """Get seasonal precipitation normal for more accurate forecasting"""
         
-        # Get data for the same month across all years
-        month_data = [d for d in historical_data if d.date.month == forecast_date.month]
-        
+        # month_data holds the same calendar month across all years
         if not month_data:
             return 0.0
         
@@ -535,13 +605,10 @@ class ForecastService:
     
     def _calculate_seasonal_precipitation_variance(
         self, 
-        historical_data: List[HistoricalWeatherData], 
-        forecast_date: date
+        month_data: List[HistoricalWeatherData]
     ) -> float:
         """Calculate seasonal precipitation variance for better uncertainty modeling"""
         
-        month_data = [d for d in historical_data if d.date.month == forecast_date.month]
-        
         if len(month_data) < 3:
             return 0.2  # Default moderate variance
         
@@ -564,18 +631,12 @@ class ForecastService:
 
     def _calculate_realistic_wind_speed(
         self,
-        historical_data: List[HistoricalWeatherData],
+        month_data: List[HistoricalWeatherData],
         forecast_date: date,
         base_wind_speed: float
     ) -> float:
         """Calculate realistic wind speed using proper climatological methods."""
         
-        month = forecast_date.month
-        day_of_year = forecast_date.timetuple().tm_yday
-        
-        # Get historical wind data for the month
-        month_data = [d for d in historical_data if d.date.month == month]
-        
         if len(month_data) >= 10:
             # Use historical climatology approach
             return self._calculate_climatological_wind(month_data, forecast_date, base_wind_speed)
@@ -592,17 +653,14 @@ class ForecastService:
         """Calculate wind using historical climatological patterns."""
         
         # Extract wind speeds and create climatology
-        wind_speeds = [d.wind_speed for d in month_data if d.wind_speed > 0]
+        wind_speeds = np.array([d.wind_speed for d in month_data if d.wind_speed > 0])
         
-        if not wind_speeds:
+        if wind_speeds.size == 0:
             return self._calculate_synthetic_wind(forecast_date, base_wind_speed)
         
-        # Calculate climatological statistics
-        wind_mean = np.mean(wind_speeds)
-        wind_median = np.median(wind_speeds)
+        # Calculate climatological statistics (quartiles in a single selection pass)
+        wind_p25, wind_median, wind_p75 = np.percentile(wind_speeds, [25, 50, 75])
         wind_std = np.std(wind_speeds)
-        wind_p25 = np.percentile(wind_speeds, 25)
-        wind_p75 = np.percentile(wind_speeds, 75)
         
         # Day-of-month variation (some days are typically windier)
         day_factor = 1.0 + 0.1 * np.sin(forecast_date.day * 2 * np.pi / 31)
@@ -663,22 +721,7 @@ class ForecastService:
         )
         
         # Monthly fine-tuning based on typical patterns
-        monthly_factors = {
-            1: 1.2,   # January - Winter storm season
-            2: 1.15,  # February - Still stormy
-            3: 1.1,   # March - Transition, still windy
-            4: 1.0,   # April - Spring, moderate
-            5: 0.9,   # May - Spring, calming
-            6: 0.8,   # June - Early summer, calm
-            7: 0.75,  # July - Summer minimum
-            8: 0.8,   # August - Late summer
-            9: 0.9,   # September - Fall pickup
-            10: 1.0,  # October - Fall winds increasing
-            11: 1.1,  # November - Getting stormy
-            12: 1.15  # December - Winter storm approach
-        }
-        
-        monthly_factor = monthly_factors.get(month, 1.0)
+        monthly_factor = self.SYNTHETIC_WIND_MONTH_FACTORS[month - 1]
         
         # Apply monthly adjustment
         adjusted_seasonal = seasonal_wind * monthly_factor
@@ -706,106 +749,23 @@ class ForecastService:
     def _get_seasonal_wind_factor(self, month: int) -> float:
         """Get seasonal wind factor based on typical patterns."""
         
-        # More moderate seasonal wind patterns (Northern Hemisphere)
-        seasonal_factors = {
-            1: 1.15,  # January - Winter, stronger winds
-            2: 1.15,  # February - Winter, stronger winds  
-            3: 1.05,  # March - Transition, moderate winds
-            4: 1.0,   # April - Spring, moderate winds
-            5: 0.95,  # May - Spring, slightly calmer
-            6: 0.9,   # June - Early summer, calmer
-            7: 0.9,   # July - Summer, calmer
-            8: 0.9,   # August - Late summer, calmer
-            9: 0.95,  # September - Early fall, increasing
-            10: 1.0,  # October - Fall, moderate
-            11: 1.05, # November - Late fall, increasing
-            12: 1.15  # December - Early winter, stronger
-        }
-        
-        return seasonal_factors.get(month, 1.0)
+        if 1 <= month <= 12:
+            return self.SEASONAL_WIND_FACTORS[month - 1]
+        return 1.0
 
     def _get_seasonal_wind_base(self, month: int) -> float:
         """Get realistic wind speed base values for each month when no historical data."""
         
-        # More realistic monthly wind speeds (km/h) for temperate climate
-        seasonal_base = {
-            1: 18.0,  # January - Winter storms, stronger winds
-            2: 17.0,  # February - Still windy in winter
-            3: 16.0,  # March - Transition, still breezy
-            4: 14.0,  # April - Spring, moderate winds
-            5: 12.0,  # May - Spring, calmer but still breezy
-            6: 11.0,  # June - Early summer, lighter winds
-            7: 10.0,  # July - Summer, lightest winds
-            8: 11.0,  # August - Late summer, picking up
-            9: 13.0,  # September - Fall transition, windier
-            10: 15.0, # October - Fall, getting windier
-            11: 16.0, # November - Late fall, windy
-            12: 17.0  # December - Winter approaching, strong winds
-        }
-        
-        return seasonal_base.get(month, 14.0)
-
-    def _calculate_precipitation_probability(
-        self,
-        historical_data: List[HistoricalWeatherData],
-        forecast_date: date,
-        forecasted_precip: float
-    ) -> float:
-        """Calculate precipitation probability based on climatological patterns."""
-        month = forecast_date.month
-        
-        # Get same month data
-        same_month_data = [
-            record for record in historical_data
-            if record.date.month == month
-        ]
-        
-        if not same_month_data:
-            # Default probability based on forecasted amount
-            if forecasted_precip < 0.1:
-                return 10.0
-            elif forecasted_precip < 1.0:
-                return 30.0
-            elif forecasted_precip < 5.0:
-                return 60.0
-            else:
-                return 85.0
-        
-        # Count days with measurable precipitation (> 0.1mm)
-        wet_days = sum(1 for record in same_month_data 
-                      if record.precipitation > 0.1)
-        total_days = len(same_month_data)
-        
-        # Base probability from climatology
-        base_prob = (wet_days / total_days) * 100 if total_days > 0 else 20.0
-        
-        # Adjust based on forecasted amount
-        if forecasted_precip < 0.1:
-            # Very low precipitation
-            probability = base_prob * 0.2
-        elif forecasted_precip < 1.0:
-            # Light precipitation
-            probability = base_prob * 0.6
-        elif forecasted_precip < 5.0:
-            # Moderate precipitation
-            probability = base_prob * 1.0
-        elif forecasted_precip < 15.0:
-            # Heavy precipitation
-            probability = min(90.0, base_prob * 1.3)
-        else:
-            # Very heavy precipitation
-            probability = min(95.0, base_prob * 1.5)
-        
-        return min(100.0, max(5.0, probability))
+        if 1 <= month <= 12:
+            return self.SEASONAL_WIND_BASE[month - 1]
+        return 14.0
 
     def _calculate_precipitation_probability(
         self, 
-        historical_data: List[HistoricalWeatherData], 
-        forecast_date: date, 
+        month_data: List[HistoricalWeatherData], 
         forecasted_precip: float
     ) -> float:
         """Calculate precipitation probability based on climatological patterns."""
-        month_data = [d for d in historical_data if d.date.month == forecast_date.month]
         
         if not month_data:
             # Default probabilities based on forecasted amount
@@ -1,6 +1,6 @@
 import asyncio
 import httpx
-from datetime import datetime, date, timedelta
+from datetime import date, timedelta
 from typing import List, Dict, Optional, Tuple
 import numpy as np
 from diskcache import Cache
@@ -18,6 +18,7 @@ class HistoricalDataService:
     def __init__(self):
         self.settings = get_settings()
         self.cache = Cache(self.settings.cache_dir)
+        self._client: Optional[httpx.AsyncClient] = None
         self.base_url = "https://power.larc.nasa.gov/api/temporal/daily/point"
         
         # NASA POWER parameters mapping
@@ -31,6 +32,21 @@ class HistoricalDataService:
             "PS": "pressure"                   # Surface Pressure (kPa)
         }
     
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the shared HTTP client, creating it on first use"""
+        
+        # Reusing one client keeps connections to the NASA POWER API alive between requests
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(timeout=60.0)
+        return self._client
+    
+    async def close(self):
+        """Close the shared HTTP client"""
+        
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+    
     async def fetch_historical_data(
         self, 
         latitude: float, 
@@ -63,10 +79,9 @@ class HistoricalDataService:
                 f"&format=JSON"
             )
             
-            async with httpx.AsyncClient(timeout=60.0) as client:
-                response = await client.get(url)
-                response.raise_for_status()
-                data = response.json()
+            response = await self._get_client().get(url)
+            response.raise_for_status()
+            data = response.json()
             
             historical_records = self._parse_nasa_power_response(data)
             
@@ -91,20 +106,30 @@ class HistoricalDataService:
             first_param = list(parameters_data.keys())[0]
             dates = list(parameters_data[first_param].keys())
             
+            # Look up each parameter series once rather than per date
+            temp_max_series = parameters_data.get("T2M_MAX", {})
+            temp_min_series = parameters_data.get("T2M_MIN", {})
+            precipitation_series = parameters_data.get("PRECTOTCORR", {})
+            humidity_series = parameters_data.get("RH2M", {})
+            wind_speed_series = parameters_data.get("WS2M", {})
+            wind_direction_series = parameters_data.get("WD2M", {})
+            pressure_series = parameters_data.get("PS", {})
+            
             records = []
             
             for date_str in dates:
                 try:
-                    record_date = datetime.strptime(date_str, "%Y%m%d").date()
+                    # Dates are fixed-width YYYYMMDD; slicing avoids strptime's format parsing
+                    record_date = date(int(date_str[:4]), int(date_str[4:6]), int(date_str[6:8]))
                     
                     # Extract values for each parameter
-                    temp_max = parameters_data.get("T2M_MAX", {}).get(date_str, np.nan)
-                    temp_min = parameters_data.get("T2M_MIN", {}).get(date_str, np.nan)
-                    precipitation = parameters_data.get("PRECTOTCORR", {}).get(date_str, np.nan)
-                    humidity = parameters_data.get("RH2M", {}).get(date_str, np.nan)
-                    wind_speed = parameters_data.get("WS2M", {}).get(date_str, np.nan)
-                    wind_direction_degrees = parameters_data.get("WD2M", {}).get(date_str, np.nan)
-                    pressure = parameters_data.get("PS", {}).get(date_str, np.nan)
+                    temp_max = temp_max_series.get(date_str, np.nan)
+                    temp_min = temp_min_series.get(date_str, np.nan)
+                    precipitation = precipitation_series.get(date_str, np.nan)
+                    humidity = humidity_series.get(date_str, np.nan)
+                    wind_speed = wind_speed_series.get(date_str, np.nan)
+                    wind_direction_degrees = wind_direction_series.get(date_str, np.nan)
+                    pressure = pressure_series.get(date_str, np.nan)
                     
                     # Skip records with critical missing data
                     if any(np.isnan(val) or val == -999 for val in [temp_max, temp_min]):
@@ -226,29 +251,27 @@ class HistoricalDataService:
         if not data:
             return {"overall_quality": 0.0, "completeness": 0.0, "consistency": 0.0}
         
-        # Check for reasonable ranges
-        temp_outliers = 0
-        precip_outliers = 0
-        humidity_outliers = 0
-        
-        for record in data:
-            # Temperature checks
-            if record.temperature_max < -50 or record.temperature_max > 60:
-                temp_outliers += 1
-            if record.temperature_min < -60 or record.temperature_min > 50:
-                temp_outliers += 1
-            if record.temperature_max < record.temperature_min:
-                temp_outliers += 1
-            
-            # Precipitation checks
-            if record.precipitation < 0 or record.precipitation > 500:  # 500mm in a day is extreme but possible
-                precip_outliers += 1
-            
-            # Humidity checks
-            if record.humidity < 0 or record.humidity > 100:
-                humidity_outliers += 1
-        
         total_records = len(data)
+        values = np.array([
+            (record.temperature_max, record.temperature_min, record.precipitation, record.humidity)
+            for record in data
+        ], dtype=np.float64)
+        temp_max, temp_min, precipitation, humidity = values.T
+        
+        # Check for reasonable ranges (one vectorised pass per check)
+        # Temperature checks
+        temp_outliers = int(
+            np.count_nonzero((temp_max < -50) | (temp_max > 60)) +
+            np.count_nonzero((temp_min < -60) | (temp_min > 50)) +
+            np.count_nonzero(temp_max < temp_min)
+        )
+        
+        # Precipitation checks
+        precip_outliers = int(np.count_nonzero((precipitation < 0) | (precipitation > 500)))  # 500mm in a day is extreme but possible
+        
+        # Humidity checks
+        humidity_outliers = int(np.count_nonzero((humidity < 0) | (humidity > 100)))
+        
         temp_quality = 1.0 - (temp_outliers / (total_records * 3))  # 3 temp checks per record
         precip_quality = 1.0 - (precip_outliers / total_records)
         humidity_quality = 1.0 - (humidity_outliers / total_records)
@@ -256,15 +279,10 @@ class HistoricalDataService:
         overall_quality = (temp_quality + precip_quality + humidity_quality) / 3
         
         # Check temporal consistency
-        sorted_data = sorted(data, key=lambda x: x.date)
-        date_gaps = 0
+        ordinals = np.sort(np.fromiter((record.date.toordinal() for record in data), dtype=np.int64, count=total_records))
+        date_gaps = int(np.count_nonzero(np.diff(ordinals) != 1))
         
-        for i in range(1, len(sorted_data)):
-            expected_date = sorted_data[i-1].date + timedelta(days=1)
-            if sorted_data[i].date != expected_date:
-                date_gaps += 1
-        
-        consistency = 1.0 - (date_gaps / max(1, len(sorted_data) - 1))
+        consistency = 1.0 - (date_gaps / max(1, total_records - 1))
         
         return {
             "overall_quality": max(0.0, min(1.0, overall_quality)) * 100,
@@ -279,11 +297,22 @@ class HistoricalDataService:
         self, 
         latitude: float, 
         longitude: float,
-        days: int = 7
+        days: int = 7,
+        historical_data: Optional[List[HistoricalWeatherData]] = None
     ) -> List[HistoricalWeatherData]:
-        """Get recent weather conditions for persistence forecasting"""
+        """Get recent weather conditions for persistence forecasting
+        
+        If historical_data already covers the recent window (as the output of
+        get_last_n_years_data does), the records are taken from it instead of
+        requesting the same days from the API again.
+        """
         
         end_date = date.today() - timedelta(days=1)
         start_date = end_date - timedelta(days=days)
         
+        if historical_data:
+            recent_data = [d for d in historical_data if start_date <= d.date <= end_date]
+            if recent_data:
+                return recent_data
+        
         return await self.fetch_historical_data(latitude, longitude, start_date, end_date)
\ No newline at end of file
@@ -3,19 +3,19 @@ from typing import List, Tuple, Optional
 import calendar
 
 
+# Meteorological season for each month, indexed by month - 1
+MONTH_SEASONS = (
+    "winter", "winter",
+    "spring", "spring", "spring",
+    "summer", "summer", "summer",
+    "autumn", "autumn", "autumn",
+    "winter"
+)
+
+
 def get_season(date_obj: date) -> str:
     """Get meteorological season for a given date"""
-    
-    month = date_obj.month
-    
-    if month in [12, 1, 2]:
-        return "winter"
-    elif month in [3, 4, 5]:
-        return "spring"
-    elif month in [6, 7, 8]:
-        return "summer"
-    else:  # [9, 10, 11]
-        return "autumn"
+    return MONTH_SEASONS[date_obj.month - 1]
 
 
 def get_season_dates(year: int, season: str) -> Tuple[date, date]:
@@ -223,46 +223,51 @@ def smooth_time_series(values: List[float], window_size: int = 7) -> List[float]
     if window_size < 1:
         return values
     
-    smoothed = []
+    series = np.asarray(values, dtype=np.float64)
+    n = len(series)
     half_window = window_size // 2
     
-    for i in range(len(values)):
-        start_idx = max(0, i - half_window)
-        end_idx = min(len(values), i + half_window + 1)
-        
-        window_values = [v for v in values[start_idx:end_idx] if not math.isnan(v)]
-        
-        if window_values:
-            smoothed.append(sum(window_values) / len(window_values))
-        else:
-            smoothed.append(values[i])
-    
-    return smoothed
+    # Prefix sums of valid values and counts give each window total in O(1)
+    valid = ~np.isnan(series)
+    value_sums = np.concatenate(([0.0], np.cumsum(np.where(valid, series, 0.0))))
+    value_counts = np.concatenate(([0], np.cumsum(valid)))
+    
+    indices = np.arange(n)
+    start_idx = np.maximum(indices - half_window, 0)
+    end_idx = np.minimum(indices + half_window + 1, n)
+    
+    window_sums = value_sums[end_idx] - value_sums[start_idx]
+    window_counts = value_counts[end_idx] - value_counts[start_idx]
+    
+    smoothed = np.divide(
+        window_sums, window_counts,
+        out=series.copy(), where=window_counts > 0
+    )
+    
+    return smoothed.tolist()
 
 
 def detect_outliers(values: List[float], threshold: float = 3.0) -> List[bool]:
     """Detect outliers using modified z-score method"""
     
+    series = np.asarray(values, dtype=np.float64)
+    valid = ~np.isnan(series)
+    
     # Calculate median and median absolute deviation
-    sorted_values = sorted([v for v in values if not math.isnan(v)])
+    sorted_values = np.sort(series[valid])
     n = len(sorted_values)
     
     if n < 3:
         return [False] * len(values)
     
     median = sorted_values[n // 2]
-    mad = np.median([abs(v - median) for v in sorted_values])
+    mad = np.median(np.abs(sorted_values - median))
     
     if mad == 0:
         return [False] * len(values)
     
     # Calculate modified z-scores
-    outliers = []
-    for value in values:
-        if math.isnan(value):
-            outliers.append(False)
-        else:
-            modified_z_score = 0.6745 * (value - median) / mad
-            outliers.append(abs(modified_z_score) > threshold)
-    
-    return outliers
\ No newline at end of file
+    modified_z_scores = 0.6745 * (series - median) / mad
+    outliers = valid & (np.abs(modified_z_scores) > threshold)
+    
+    return outliers.tolist()